@@ -49,7 +49,7 @@ def main():
     
     # Get all data
     print("All key-value pairs:")
-    for key, value in sorted(db.items().items()):
+    for key, value in db.sorted_items():
         print(f"  {key} => {value}")
     print()
     
@@ -57,7 +57,8 @@ def main():
     stats = db.stats()
     print("Database Statistics:")
     print(f"  Entries: {stats['total_entries']}")
-    print(f"  Buckets used: {stats['used_buckets']}/1024")
+    print(f"  Buckets used: {stats['used_buckets']}/{stats['bucket_count']}")
+    print(f"  Load factor: {stats['load_factor']:.2f}")
     print(f"  Collisions: {stats['total_collisions']}")
     print(f"  Max chain: {stats['max_chain_length']}\n")
     
@@ -105,9 +105,9 @@ class GraphDB:
             self.db.delete(edge_key)
         
         # Remove from adjacency lists
-        for adj_key in self.db.keys():
+        for adj_key, adj_json in self.db.iteritems():
             if adj_key.startswith("adj:") and adj_key != f"adj:{node_id}":
-                adj_list = json.loads(self.db.get(adj_key))
+                adj_list = json.loads(adj_json)
                 adj_list = [item for item in adj_list if item.get('to') != node_id]
                 self.db.set(adj_key, json.dumps(adj_list))
         
@@ -305,7 +305,7 @@ class GraphDB:
         edges = []
         seen = set()
         
-        for key in self.db.keys():
+        for key, value in self.db.iteritems():
             if key.startswith("edge:"):
                 parts = key.split(":")
                 if len(parts) >= 3:
@@ -318,7 +318,7 @@ class GraphDB:
                             continue
                         seen.add(edge_tuple)
                     
-                    edge_data = json.loads(self.db.get(key))
+                    edge_data = json.loads(value)
                     weight = edge_data.get("weight") if self.weighted else None
                     edges.append((from_node, to_node, weight))
         
@@ -20,6 +20,7 @@
 #include <string.h>
 #include <stdint.h>
 #include <stdbool.h>
+#include "simple_db.h"
 
 // ============================================================================
 // CONFIGURATION
@@ -41,18 +42,10 @@ typedef struct Entry {
 } Entry;
 
 // Database structure
-typedef struct Database {
+struct Database {
     Entry *table[HASH_TABLE_SIZE];
     size_t count;  // Number of entries
-} Database;
-
-// Statistics structure
-typedef struct DBStats {
-    size_t total_entries;
-    size_t total_collisions;
-    size_t max_chain_length;
-    size_t used_buckets;
-} DBStats;
+};
 
 // ============================================================================
 // HASH FUNCTION
@@ -168,6 +161,21 @@ bool db_set(Database *db, const char *key, const char *value) {
     return true;
 }
 
+// Insert or update many key-value pairs in one call
+// Returns true only if every pair was stored
+bool db_set_many(Database *db, const char **keys, const char **values, size_t n) {
+    if (!db || !keys || !values) return false;
+    
+    bool ok = true;
+    for (size_t i = 0; i < n; i++) {
+        if (!db_set(db, keys[i], values[i])) {
+            ok = false;
+        }
+    }
+    
+    return ok;
+}
+
 // Get a value by key
 const char* db_get(Database *db, const char *key) {
     if (!db || !key) return NULL;
@@ -185,6 +193,16 @@ const char* db_get(Database *db, const char *key) {
     return NULL;  // Key not found
 }
 
+// Look up many keys in one call
+// values[i] receives the value for keys[i], or NULL if not found
+void db_get_many(Database *db, const char **keys, const char **values, size_t n) {
+    if (!keys || !values) return;
+    
+    for (size_t i = 0; i < n; i++) {
+        values[i] = db_get(db, keys[i]);
+    }
+}
+
 // Delete a key-value pair
 bool db_delete(Database *db, const char *key) {
     if (!db || !key) return false;
@@ -262,9 +280,72 @@ char** db_keys(Database *db, size_t *count) {
     return keys;
 }
 
+// Copy all key pointers into a caller-owned buffer of `cap` slots
+// Sets *count to the number of keys; returns false (leaving buf untouched)
+// if cap is too small, so the caller can grow the buffer and retry
+bool db_keys_into(Database *db, char **buf, size_t cap, size_t *count) {
+    if (!db || !count) return false;
+    
+    *count = db->count;
+    if (db->count > cap) return false;
+    if (db->count == 0) return true;
+    if (!buf) return false;
+    
+    size_t idx = 0;
+    for (size_t i = 0; i < HASH_TABLE_SIZE; i++) {
+        for (Entry *entry = db->table[i]; entry; entry = entry->next) {
+            buf[idx++] = entry->key;
+        }
+    }
+    
+    return true;
+}
+
+// Get all key-value pairs as an interleaved array
+// [key0, value0, key1, value1, ...] (caller must free the returned array)
+char** db_items(Database *db, size_t *count) {
+    if (!db || !count) return NULL;
+    
+    *count = db->count;
+    if (db->count == 0) return NULL;
+    
+    char **items = (char**)malloc(sizeof(char*) * db->count * 2);
+    if (!items) return NULL;
+    
+    size_t idx = 0;
+    for (size_t i = 0; i < HASH_TABLE_SIZE; i++) {
+        Entry *entry = db->table[i];
+        while (entry) {
+            items[idx++] = entry->key;
+            items[idx++] = entry->value;
+            entry = entry->next;
+        }
+    }
+    
+    return items;
+}
+
+// Call fn(key, value, ctx) for every entry, walking the table in place
+// (fn must not modify the database)
+void db_foreach(Database *db, db_foreach_fn fn, void *ctx) {
+    if (!db || !fn) return;
+    
+    for (size_t i = 0; i < HASH_TABLE_SIZE; i++) {
+        for (Entry *entry = db->table[i]; entry; entry = entry->next) {
+            fn(entry->key, entry->value, ctx);
+        }
+    }
+}
+
+// Free an array returned by db_keys() or db_items()
+// (only the array itself; the strings belong to the database)
+void db_free_keys(char **keys) {
+    free(keys);
+}
+
 // Get database statistics
 DBStats db_stats(Database *db) {
-    DBStats stats = {0, 0, 0, 0};
+    DBStats stats = {0, 0, 0, 0, HASH_TABLE_SIZE};
     if (!db) return stats;
     
     stats.total_entries = db->count;
@@ -319,6 +400,12 @@ void db_print(Database *db) {
 
 #ifdef BUILD_STANDALONE
 
+// db_foreach() callback: print the entry and count it in *ctx
+static void print_entry(const char *key, const char *value, void *ctx) {
+    printf("  %s => %s\n", key, value);
+    (*(size_t*)ctx)++;
+}
+
 int main(void) {
     printf("Simple In-Memory Database - Standalone Test\n");
     printf("============================================\n\n");
@@ -373,10 +460,16 @@ int main(void) {
         for (size_t i = 0; i < key_count; i++) {
             printf("  Key %zu: %s\n", i, keys[i]);
         }
-        free(keys);
+        db_free_keys(keys);
     }
     printf("\n");
     
+    // Test FOREACH operation
+    printf("Testing FOREACH operation...\n");
+    size_t visited = 0;
+    db_foreach(db, print_entry, &visited);
+    printf("Visited %zu of %zu entries\n\n", visited, db_count(db));
+    
     // Test DELETE operation
     printf("Testing DELETE operation...\n");
     db_delete(db, "city");
@@ -406,9 +499,9 @@ int main(void) {
     stats = db_stats(db);
     printf("Final Statistics:\n");
     printf("  Total entries: %zu\n", stats.total_entries);
-    printf("  Used buckets: %zu / %d (%.1f%%)\n", 
-           stats.used_buckets, HASH_TABLE_SIZE,
-           (100.0 * stats.used_buckets) / HASH_TABLE_SIZE);
+    printf("  Used buckets: %zu / %zu (%.1f%%)\n", 
+           stats.used_buckets, stats.bucket_count,
+           (100.0 * stats.used_buckets) / stats.bucket_count);
     printf("  Total collisions: %zu\n", stats.total_collisions);
     printf("  Max chain length: %zu\n", stats.max_chain_length);
     printf("  Avg chain length: %.2f\n\n", 
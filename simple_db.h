@@ -0,0 +1,47 @@
+#ifndef SIMPLE_DB_H
+#define SIMPLE_DB_H
+
+#include <stddef.h>
+#include <stdbool.h>
+
+// Opaque database handle
+typedef struct Database Database;
+
+// Statistics structure
+typedef struct DBStats {
+    size_t total_entries;
+    size_t total_collisions;
+    size_t max_chain_length;
+    size_t used_buckets;
+    size_t bucket_count;
+} DBStats;
+
+// Callback for db_foreach()
+typedef void (*db_foreach_fn)(const char *key, const char *value, void *ctx);
+
+// Lifecycle
+Database* db_create(void);
+void db_destroy(Database *db);
+
+// CRUD operations
+bool db_set(Database *db, const char *key, const char *value);
+const char* db_get(Database *db, const char *key);
+bool db_delete(Database *db, const char *key);
+bool db_exists(Database *db, const char *key);
+
+// Batch operations
+bool db_set_many(Database *db, const char **keys, const char **values, size_t n);
+void db_get_many(Database *db, const char **keys, const char **values, size_t n);
+
+// Utility operations
+size_t db_count(Database *db);
+void db_clear(Database *db);
+char** db_keys(Database *db, size_t *count);
+bool db_keys_into(Database *db, char **buf, size_t cap, size_t *count);
+char** db_items(Database *db, size_t *count);
+void db_free_keys(char **keys);
+void db_foreach(Database *db, db_foreach_fn fn, void *ctx);
+DBStats db_stats(Database *db);
+void db_print(Database *db);
+
+#endif
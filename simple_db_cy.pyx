@@ -0,0 +1,397 @@
+# cython: language_level=3
+# distutils: sources = simple_db.c
+"""
+Simple In-Memory Database - Cython Extension
+
+Native interface to the C database. Calls db_* directly instead of going
+through ctypes, so each operation skips the foreign-function dispatch.
+Exposes the same API as simple_db_python.SimpleDB.
+
+Build:
+    make build-db-cy
+
+Usage:
+    from simple_db_cy import SimpleDB
+
+    db = SimpleDB()
+    db.set("name", "Alice")
+    print(db.get("name"))  # Alice
+    print(db.count())      # 1
+"""
+
+import heapq
+
+from libc.stdlib cimport malloc, free
+
+# ============================================================================
+# C Declarations
+# ============================================================================
+
+cdef extern from "simple_db.h":
+    ctypedef struct Database:
+        pass
+
+    ctypedef struct DBStats:
+        size_t total_entries
+        size_t total_collisions
+        size_t max_chain_length
+        size_t used_buckets
+        size_t bucket_count
+
+    Database* db_create()
+    void db_destroy(Database *db)
+    bint db_set(Database *db, const char *key, const char *value)
+    const char* db_get(Database *db, const char *key)
+    bint db_delete(Database *db, const char *key)
+    bint db_exists(Database *db, const char *key)
+    bint db_set_many(Database *db, const char **keys, const char **values, size_t n)
+    void db_get_many(Database *db, const char **keys, const char **values, size_t n)
+    size_t db_count(Database *db)
+    void db_clear(Database *db)
+    char** db_keys(Database *db, size_t *count)
+    char** db_items(Database *db, size_t *count)
+    void db_free_keys(char **keys)
+    DBStats db_stats(Database *db)
+    void db_print(Database *db)
+
+# ============================================================================
+# Extension Class
+# ============================================================================
+
+cdef class SimpleDB:
+    """Native wrapper for the simple in-memory database"""
+
+    cdef Database *_db
+
+    def __cinit__(self):
+        """Create a new database instance"""
+        self._db = db_create()
+        if self._db is NULL:
+            raise MemoryError("Failed to create database")
+
+    def __dealloc__(self):
+        """Destroy the database when the object is garbage collected"""
+        self._close()
+
+    cdef void _close(self):
+        if self._db is not NULL:
+            db_destroy(self._db)
+            self._db = NULL
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self._close()
+        return False
+
+    def set(self, key, value):
+        """
+        Set a key-value pair in the database
+
+        Args:
+            key: The key (max 256 characters)
+            value: The value (max 4096 characters)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not isinstance(key, str) or not isinstance(value, str):
+            raise TypeError("Key and value must be strings")
+
+        return self.set_fast(key, value)
+
+    def set_fast(self, str key, str value):
+        """
+        Set a key-value pair without validating argument types
+
+        Only use this when the caller guarantees key and value are strings.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        cdef bytes kb = key.encode('utf-8')
+        cdef bytes vb = value.encode('utf-8')
+        return db_set(self._db, kb, vb)
+
+    def get(self, key):
+        """
+        Get a value by key
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The value if found, None otherwise
+        """
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+
+        return self.get_fast(key)
+
+    def get_fast(self, str key):
+        """
+        Get a value by key without validating the argument type
+
+        Only use this when the caller guarantees key is a string.
+
+        Returns:
+            The value if found, None otherwise
+        """
+        cdef bytes kb = key.encode('utf-8')
+        cdef const char *result = db_get(self._db, kb)
+        return result.decode('utf-8') if result is not NULL else None
+
+    def delete(self, key):
+        """
+        Delete a key-value pair
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            True if deleted, False if key not found
+        """
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+
+        cdef bytes kb = key.encode('utf-8')
+        return db_delete(self._db, kb)
+
+    def exists(self, key):
+        """
+        Check if a key exists
+
+        Args:
+            key: The key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+
+        cdef bytes kb = key.encode('utf-8')
+        return db_exists(self._db, kb)
+
+    def set_many(self, items):
+        """
+        Set many key-value pairs with a single C call
+
+        Args:
+            items: Iterable of (key, value) string pairs
+
+        Returns:
+            True if every pair was stored, False otherwise
+        """
+        pairs = list(items)
+        if not all(isinstance(k, str) and isinstance(v, str) for k, v in pairs):
+            raise TypeError("Key and value must be strings")
+
+        cdef size_t n = len(pairs)
+        if n == 0:
+            return True
+
+        # Keep the encoded bytes alive while C reads from them
+        cdef list encoded = [(k.encode('utf-8'), v.encode('utf-8')) for k, v in pairs]
+        cdef const char **keys = <const char **>malloc(n * sizeof(char *))
+        cdef const char **values = <const char **>malloc(n * sizeof(char *))
+        cdef size_t i
+        try:
+            if keys is NULL or values is NULL:
+                raise MemoryError("Failed to allocate batch arrays")
+            for i in range(n):
+                keys[i] = <bytes>encoded[i][0]
+                values[i] = <bytes>encoded[i][1]
+            return db_set_many(self._db, keys, values, n)
+        finally:
+            free(keys)
+            free(values)
+
+    def get_many(self, keys):
+        """
+        Get the values for many keys with a single C call
+
+        Args:
+            keys: Iterable of keys to look up
+
+        Returns:
+            List of values in the same order as keys (None where not found)
+        """
+        keys = list(keys)
+        if not all(isinstance(k, str) for k in keys):
+            raise TypeError("Key must be a string")
+
+        cdef size_t n = len(keys)
+        if n == 0:
+            return []
+
+        cdef list encoded = [k.encode('utf-8') for k in keys]
+        cdef const char **key_array = <const char **>malloc(n * sizeof(char *))
+        cdef const char **values = <const char **>malloc(n * sizeof(char *))
+        cdef size_t i
+        try:
+            if key_array is NULL or values is NULL:
+                raise MemoryError("Failed to allocate batch arrays")
+            for i in range(n):
+                key_array[i] = <bytes>encoded[i]
+            db_get_many(self._db, key_array, values, n)
+            return [
+                values[i].decode('utf-8') if values[i] is not NULL else None
+                for i in range(n)
+            ]
+        finally:
+            free(key_array)
+            free(values)
+
+    def count(self):
+        """
+        Get the number of entries in the database
+
+        Returns:
+            The number of key-value pairs
+        """
+        return db_count(self._db)
+
+    def clear(self):
+        """Clear all entries from the database"""
+        db_clear(self._db)
+
+    def keys(self):
+        """
+        Get all keys in the database
+
+        Returns:
+            List of all keys
+        """
+        cdef size_t count = 0
+        cdef size_t i
+        cdef char **keys_ptr = db_keys(self._db, &count)
+
+        if keys_ptr is NULL:
+            return []
+
+        try:
+            return [keys_ptr[i].decode('utf-8') for i in range(count)]
+        finally:
+            # Free the array (but not the strings, they belong to the database)
+            db_free_keys(keys_ptr)
+
+    cdef list _pairs(self):
+        cdef size_t count = 0
+        cdef size_t i
+        cdef char **items_ptr = db_items(self._db, &count)
+
+        if items_ptr is NULL:
+            return []
+
+        try:
+            return [
+                (items_ptr[2 * i].decode('utf-8'),
+                 items_ptr[2 * i + 1].decode('utf-8'))
+                for i in range(count)
+            ]
+        finally:
+            # Free the array (but not the strings, they belong to the database)
+            db_free_keys(items_ptr)
+
+    def items(self):
+        """
+        Get all key-value pairs
+
+        Returns:
+            Dictionary of all key-value pairs
+        """
+        return dict(self._pairs())
+
+    def iteritems(self):
+        """
+        Iterate over all key-value pairs without building a dictionary
+
+        Returns:
+            Iterator of (key, value) tuples
+        """
+        return iter(self._pairs())
+
+    def sorted_items(self, limit=None):
+        """
+        Get key-value pairs sorted by key
+
+        Args:
+            limit: If given, return only the first `limit` pairs; selected
+                with a heap in O(n log limit) instead of sorting everything
+
+        Returns:
+            List of (key, value) tuples in key order
+        """
+        items = self._pairs()
+        if limit is not None:
+            return heapq.nsmallest(limit, items)
+        items.sort()
+        return items
+
+    def stats(self):
+        """
+        Get database statistics
+
+        Returns:
+            Dictionary with statistics:
+            - total_entries: Number of entries
+            - used_buckets: Number of hash buckets in use
+            - bucket_count: Total number of hash buckets
+            - load_factor: Entries per bucket
+            - total_collisions: Number of hash collisions
+            - max_chain_length: Longest collision chain
+        """
+        cdef DBStats stats = db_stats(self._db)
+        return {
+            'total_entries': stats.total_entries,
+            'used_buckets': stats.used_buckets,
+            'bucket_count': stats.bucket_count,
+            'load_factor': stats.total_entries / stats.bucket_count,
+            'total_collisions': stats.total_collisions,
+            'max_chain_length': stats.max_chain_length,
+        }
+
+    def print(self):
+        """Print database contents (for debugging)"""
+        db_print(self._db)
+
+    def __len__(self):
+        """Support len() function"""
+        return db_count(self._db)
+
+    def __contains__(self, key):
+        """Support 'in' operator"""
+        if not isinstance(key, str):
+            return False
+
+        cdef bytes kb = key.encode('utf-8')
+        return db_exists(self._db, kb)
+
+    def __getitem__(self, key):
+        """Support db[key] syntax"""
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+
+        cdef bytes kb = key.encode('utf-8')
+        cdef const char *result = db_get(self._db, kb)
+        if result is NULL:
+            raise KeyError(key)
+        return result.decode('utf-8')
+
+    def __setitem__(self, key, value):
+        """Support db[key] = value syntax"""
+        if not self.set(key, value):
+            raise RuntimeError(f"Failed to set key: {key}")
+
+    def __delitem__(self, key):
+        """Support del db[key] syntax"""
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __repr__(self):
+        """String representation"""
+        return f"<SimpleDB entries={self.count()}>"
@@ -13,9 +13,10 @@ Usage:
 """
 
 import ctypes
+import heapq
 import os
 import sys
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 
 # Determine the library name based on platform
 if sys.platform == 'darwin':
@@ -54,6 +55,7 @@ class DBStats(ctypes.Structure):
         ("total_collisions", ctypes.c_size_t),
         ("max_chain_length", ctypes.c_size_t),
         ("used_buckets", ctypes.c_size_t),
+        ("bucket_count", ctypes.c_size_t),
     ]
 
 # ============================================================================
@@ -73,6 +75,8 @@ lib.db_set.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
 lib.db_set.restype = ctypes.c_bool
 
 # const char* db_get(Database *db, const char *key)
+# Keep c_char_p: ctypes builds the bytes result in C, whereas a c_void_p
+# restype plus ctypes.string_at() costs a second foreign call per lookup
 lib.db_get.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 lib.db_get.restype = ctypes.c_char_p
 
@@ -84,6 +88,24 @@ lib.db_delete.restype = ctypes.c_bool
 lib.db_exists.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 lib.db_exists.restype = ctypes.c_bool
 
+# bool db_set_many(Database *db, const char **keys, const char **values, size_t n)
+lib.db_set_many.argtypes = [
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_char_p),
+    ctypes.POINTER(ctypes.c_char_p),
+    ctypes.c_size_t,
+]
+lib.db_set_many.restype = ctypes.c_bool
+
+# void db_get_many(Database *db, const char **keys, const char **values, size_t n)
+lib.db_get_many.argtypes = [
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_char_p),
+    ctypes.POINTER(ctypes.c_char_p),
+    ctypes.c_size_t,
+]
+lib.db_get_many.restype = None
+
 # size_t db_count(Database *db)
 lib.db_count.argtypes = [ctypes.c_void_p]
 lib.db_count.restype = ctypes.c_size_t
@@ -96,6 +118,23 @@ lib.db_clear.restype = None
 lib.db_keys.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t)]
 lib.db_keys.restype = ctypes.POINTER(ctypes.c_char_p)
 
+# bool db_keys_into(Database *db, char **buf, size_t cap, size_t *count)
+lib.db_keys_into.argtypes = [
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_char_p),
+    ctypes.c_size_t,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+lib.db_keys_into.restype = ctypes.c_bool
+
+# char** db_items(Database *db, size_t *count)
+lib.db_items.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t)]
+lib.db_items.restype = ctypes.POINTER(ctypes.c_char_p)
+
+# void db_free_keys(char **keys)
+lib.db_free_keys.argtypes = [ctypes.POINTER(ctypes.c_char_p)]
+lib.db_free_keys.restype = None
+
 # DBStats db_stats(Database *db)
 lib.db_stats.argtypes = [ctypes.c_void_p]
 lib.db_stats.restype = DBStats
@@ -111,25 +150,53 @@ lib.db_print.restype = None
 class SimpleDB:
     """Python wrapper for the simple in-memory database"""
     
+    __slots__ = (
+        '_db', '_c_set', '_c_get', '_c_del', '_c_exists', '_c_count', '_keys_buf',
+    )
+    
+    def __new__(cls):
+        """Allocate the instance with no database handle yet"""
+        obj = super().__new__(cls)
+        # Set before __init__ runs so __del__ can rely on it even if
+        # __init__ fails
+        obj._db = None
+        return obj
+    
     def __init__(self):
         """Create a new database instance"""
         self._db = lib.db_create()
         if not self._db:
             raise MemoryError("Failed to create database")
+        
+        # Bind the hot-path C functions once to skip the module/attribute
+        # lookups on every call
+        self._c_set = lib.db_set
+        self._c_get = lib.db_get
+        self._c_del = lib.db_delete
+        self._c_exists = lib.db_exists
+        self._c_count = lib.db_count
+        
+        # Reused by keys(); grown on demand so polling keys() does not
+        # allocate a new array every call
+        self._keys_buf = (ctypes.c_char_p * 0)()
     
-    def __del__(self):
-        """Destroy the database when the object is garbage collected"""
-        if hasattr(self, '_db') and self._db:
+    def _close(self):
+        """Destroy the C database; safe to call more than once"""
+        if self._db:
             lib.db_destroy(self._db)
             self._db = None
     
+    def __del__(self):
+        """Destroy the database when the object is garbage collected"""
+        self._close()
+    
     def __enter__(self):
         """Context manager entry"""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.__del__()
+        self._close()
         return False
     
     def set(self, key: str, value: str) -> bool:
@@ -146,12 +213,23 @@ class SimpleDB:
         if not isinstance(key, str) or not isinstance(value, str):
             raise TypeError("Key and value must be strings")
         
-        return lib.db_set(
+        return self._c_set(
             self._db,
-            key.encode('utf-8'),
-            value.encode('utf-8')
+            key.encode(),
+            value.encode()
         )
     
+    def set_fast(self, key: str, value: str) -> bool:
+        """
+        Set a key-value pair without validating argument types
+        
+        Only use this when the caller guarantees key and value are strings.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._c_set(self._db, key.encode(), value.encode())
+    
     def get(self, key: str) -> Optional[str]:
         """
         Get a value by key
@@ -165,8 +243,20 @@ class SimpleDB:
         if not isinstance(key, str):
             raise TypeError("Key must be a string")
         
-        result = lib.db_get(self._db, key.encode('utf-8'))
-        return result.decode('utf-8') if result else None
+        result = self._c_get(self._db, key.encode())
+        return result.decode('utf-8') if result is not None else None
+    
+    def get_fast(self, key: str) -> Optional[str]:
+        """
+        Get a value by key without validating the argument type
+        
+        Only use this when the caller guarantees key is a string.
+        
+        Returns:
+            The value if found, None otherwise
+        """
+        result = self._c_get(self._db, key.encode())
+        return result.decode('utf-8') if result is not None else None
     
     def delete(self, key: str) -> bool:
         """
@@ -181,7 +271,7 @@ class SimpleDB:
         if not isinstance(key, str):
             raise TypeError("Key must be a string")
         
-        return lib.db_delete(self._db, key.encode('utf-8'))
+        return self._c_del(self._db, key.encode())
     
     def exists(self, key: str) -> bool:
         """
@@ -196,7 +286,52 @@ class SimpleDB:
         if not isinstance(key, str):
             raise TypeError("Key must be a string")
         
-        return lib.db_exists(self._db, key.encode('utf-8'))
+        return self._c_exists(self._db, key.encode())
+    
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> bool:
+        """
+        Set many key-value pairs with a single C call
+        
+        Args:
+            items: Iterable of (key, value) string pairs
+            
+        Returns:
+            True if every pair was stored, False otherwise
+        """
+        pairs = list(items)
+        if not all(isinstance(k, str) and isinstance(v, str) for k, v in pairs):
+            raise TypeError("Key and value must be strings")
+        
+        n = len(pairs)
+        if n == 0:
+            return True
+        
+        keys = (ctypes.c_char_p * n)(*[k.encode() for k, _ in pairs])
+        values = (ctypes.c_char_p * n)(*[v.encode() for _, v in pairs])
+        return lib.db_set_many(self._db, keys, values, n)
+    
+    def get_many(self, keys: Iterable[str]) -> List[Optional[str]]:
+        """
+        Get the values for many keys with a single C call
+        
+        Args:
+            keys: Iterable of keys to look up
+            
+        Returns:
+            List of values in the same order as keys (None where not found)
+        """
+        keys = list(keys)
+        if not all(isinstance(k, str) for k in keys):
+            raise TypeError("Key must be a string")
+        
+        n = len(keys)
+        if n == 0:
+            return []
+        
+        key_array = (ctypes.c_char_p * n)(*[k.encode() for k in keys])
+        values = (ctypes.c_char_p * n)()
+        lib.db_get_many(self._db, key_array, values, n)
+        return [v.decode('utf-8') if v is not None else None for v in values]
     
     def count(self) -> int:
         """
@@ -205,7 +340,7 @@ class SimpleDB:
         Returns:
             The number of key-value pairs
         """
-        return lib.db_count(self._db)
+        return self._c_count(self._db)
     
     def clear(self):
         """Clear all entries from the database"""
@@ -219,22 +354,36 @@ class SimpleDB:
             List of all keys
         """
         count = ctypes.c_size_t()
-        keys_ptr = lib.db_keys(self._db, ctypes.byref(count))
+        buf = self._keys_buf
+        
+        if not lib.db_keys_into(self._db, buf, len(buf), ctypes.byref(count)):
+            if count.value <= len(buf):
+                return []
+            
+            # Buffer too small: grow geometrically and retry
+            buf = self._keys_buf = (ctypes.c_char_p * max(count.value, 2 * len(buf)))()
+            lib.db_keys_into(self._db, buf, len(buf), ctypes.byref(count))
+        
+        return [key.decode('utf-8') for key in buf[:count.value]]
+    
+    def _raw_items(self) -> List[bytes]:
+        """Fetch the interleaved [key, value, ...] byte strings in one C call"""
+        count = ctypes.c_size_t()
+        items_ptr = lib.db_items(self._db, ctypes.byref(count))
         
-        if not keys_ptr or count.value == 0:
+        if not items_ptr or count.value == 0:
             return []
         
-        # Extract keys from C array
-        keys = []
-        for i in range(count.value):
-            key = keys_ptr[i]
-            if key:
-                keys.append(key.decode('utf-8'))
+        # Copy the interleaved [key, value, ...] array in one slice instead
+        # of indexing the pointer element by element
+        raw = ctypes.cast(
+            items_ptr, ctypes.POINTER(ctypes.c_char_p * (2 * count.value))
+        ).contents[:]
         
         # Free the array (but not the strings, they belong to the database)
-        ctypes.pythonapi.PyMem_Free(keys_ptr)
+        lib.db_free_keys(items_ptr)
         
-        return keys
+        return raw
     
     def items(self) -> Dict[str, str]:
         """
@@ -243,12 +392,38 @@ class SimpleDB:
         Returns:
             Dictionary of all key-value pairs
         """
-        result = {}
-        for key in self.keys():
-            value = self.get(key)
-            if value is not None:
-                result[key] = value
-        return result
+        raw = self._raw_items()
+        return dict(zip(map(bytes.decode, raw[0::2]), map(bytes.decode, raw[1::2])))
+    
+    def iteritems(self) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over all key-value pairs without building a dictionary
+        
+        Prefer this over items() for traversal. The pairs are fetched in
+        one C call up front and decoded lazily, so the database may be
+        modified while iterating.
+        
+        Returns:
+            Iterator of (key, value) tuples
+        """
+        raw = self._raw_items()
+        return zip(map(bytes.decode, raw[0::2]), map(bytes.decode, raw[1::2]))
+    
+    def sorted_items(self, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """
+        Get key-value pairs sorted by key
+        
+        Args:
+            limit: If given, return only the first `limit` pairs; selected
+                with a heap in O(n log limit) instead of sorting everything
+            
+        Returns:
+            List of (key, value) tuples in key order
+        """
+        items = self.iteritems()
+        if limit is not None:
+            return heapq.nsmallest(limit, items)
+        return sorted(items)
     
     def stats(self) -> dict:
         """
@@ -258,6 +433,8 @@ class SimpleDB:
             Dictionary with statistics:
             - total_entries: Number of entries
             - used_buckets: Number of hash buckets in use
+            - bucket_count: Total number of hash buckets
+            - load_factor: Entries per bucket
             - total_collisions: Number of hash collisions
             - max_chain_length: Longest collision chain
         """
@@ -265,6 +442,8 @@ class SimpleDB:
         return {
             'total_entries': stats.total_entries,
             'used_buckets': stats.used_buckets,
+            'bucket_count': stats.bucket_count,
+            'load_factor': stats.total_entries / stats.bucket_count,
             'total_collisions': stats.total_collisions,
             'max_chain_length': stats.max_chain_length,
         }
@@ -279,18 +458,24 @@ class SimpleDB:
     
     def __contains__(self, key):
         """Support 'in' operator"""
-        return self.exists(key)
+        return isinstance(key, str) and self._c_exists(self._db, key.encode())
     
     def __getitem__(self, key):
         """Support db[key] syntax"""
-        value = self.get(key)
-        if value is None:
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+        
+        result = self._c_get(self._db, key.encode())
+        if result is None:
             raise KeyError(key)
-        return value
+        return result.decode('utf-8')
     
     def __setitem__(self, key, value):
         """Support db[key] = value syntax"""
-        if not self.set(key, value):
+        if not (isinstance(key, str) and isinstance(value, str)):
+            raise TypeError("Key and value must be strings")
+        
+        if not self._c_set(self._db, key.encode(), value.encode()):
             raise RuntimeError(f"Failed to set key: {key}")
     
     def __delitem__(self, key):
@@ -355,8 +540,7 @@ if __name__ == "__main__":
     
     # Test ITEMS operation
     print("Testing ITEMS operation...")
-    items = db.items()
-    for key, value in items.items():
+    for key, value in db.iteritems():
         print(f"  {key} => {value}")
     print()
     
@@ -376,8 +560,7 @@ if __name__ == "__main__":
     
     # Performance test
     print("Performance test: Adding 1000 entries...")
-    for i in range(1000):
-        db.set(f"key_{i}", f"value_{i}")
+    db.set_many((f"key_{i}", f"value_{i}") for i in range(1000))
     print(f"✓ Added 1000 entries")
     print(f"Total count: {len(db)}")
     print()